@@ -1,3 +1,4 @@
+import io
 import os
 from typing import Optional, List
 from collections import UserDict
@@ -18,6 +19,14 @@ from highcharts_core.global_options.shared_options import SharedOptions
 class Chart(HighchartsMeta):
     """Python representation of a Highcharts ``Chart`` object."""
 
+    __slots__ = ('_callback',
+                 '_container',
+                 '_options',
+                 '_variable_name',
+                 '_module_url',
+                 '_random_slug',
+                 '__weakref__')
+
     def __init__(self, **kwargs):
         """Creates a :class:`Chart <highcharts_core.chart.Chart>` instance.
 
@@ -453,6 +462,9 @@ class Chart(HighchartsMeta):
 
     @container.setter
     def container(self, value):
+        if value is self._container:
+            return
+
         self._container = validators.string(value, allow_empty = True)
 
     @property
@@ -482,6 +494,9 @@ class Chart(HighchartsMeta):
 
     @variable_name.setter
     def variable_name(self, value):
+        if value is self._variable_name:
+            return
+
         self._variable_name = validators.variable_name(value, allow_empty = True)
 
     @classmethod
@@ -510,7 +525,8 @@ class Chart(HighchartsMeta):
                       encoding = 'utf-8',
                       careful_validation = False,
                       event_listener: str = 'DOMContentLoaded',
-                      event_listener_enabled: bool = True) -> Optional[str]:
+                      event_listener_enabled: bool = True,
+                      buf = None) -> Optional[str]:
         """Return the object represented as a :class:`str <python:str>` containing the
         JavaScript object literal.
 
@@ -546,69 +562,62 @@ class Chart(HighchartsMeta):
           If :meth:`variable_name <Chart.variable_name>` is not set, will simply return
           the ``new Chart(...)`` portion in the string.
 
+        :param buf: An optional text buffer (e.g. an :class:`io.StringIO <python:io.StringIO>`)
+          to which the JavaScript literal should be written. If supplied, ``filename``
+          is ignored and the method returns :obj:`None <python:None>`. Defaults to
+          :obj:`None <python:None>`.
+        :type buf: file-like or :obj:`None <python:None>`
+
         :rtype: :class:`str <python:str>` or :obj:`None <python:None>`
         """
 
-        untrimmed = self._to_untrimmed_dict()
-        as_dict = {}
-        for key in untrimmed:
-            item = untrimmed[key]
-            serialized = serialize_to_js_literal(item, 
-                                                 encoding = encoding,
-                                                 careful_validation = careful_validation)
-            if serialized is not None:
-                as_dict[key] = serialized
+        if buf is None:
+            writer = io.StringIO()
+        else:
+            writer = buf
+
+        if event_listener_enabled:
+            if event_listener:
+                writer.write("""document.addEventListener('""" + event_listener + """', function() {\n""")
+            else:
+                writer.write("""document.addEventListener(function() {\n""")
 
-        signature_elements = 2
+        if self.variable_name:
+            writer.write('var ' + self.variable_name + ' = ')
 
+        writer.write("""Highcharts.chart(""")
         if self.container:
-            container_as_str = f"""'{self.container}'"""
+            writer.write("'" + self.container + "'")
         else:
-            container_as_str = """null"""
+            writer.write("""null""")
 
+        writer.write(',\n')
         if self.options:
-            options_as_str = "{}".format(
-                self.options.to_js_literal(encoding = encoding,
-                                           careful_validation = careful_validation)
-            )
+            options_as_str = self.options.to_js_literal(encoding = encoding,
+                                                        careful_validation = careful_validation)
+            writer.write(options_as_str or """null""")
         else:
-            options_as_str = """null"""
+            writer.write("""null""")
 
-        callback_as_str = ''
         if self.callback:
-            callback_as_str = "{}".format(
-                self.callback.to_js_literal(encoding = encoding,
-                                            careful_validation = careful_validation)
-            )
-            signature_elements += 1
-
-        signature = """Highcharts.chart("""
-        signature += container_as_str
-        if signature_elements > 1:
-            signature += ',\n'
-        signature += options_as_str
-        if signature_elements > 1:
-            signature += ',\n'
-        if callback_as_str:
-            signature += callback_as_str
-        signature += ');'
-
-        constructor_prefix = ''
-        if self.variable_name:
-            constructor_prefix = f'var {self.variable_name} = '
-
-        as_str = constructor_prefix + signature
+            writer.write(',\n')
+            writer.write(self.callback.to_js_literal(encoding = encoding,
+                                                     careful_validation = careful_validation))
+        writer.write(');')
 
         if event_listener_enabled:
-            if event_listener:
-                prefix = """document.addEventListener('""" + event_listener + """', function() {\n"""
-            else:
-                prefix = """document.addEventListener(function() {\n"""
-            suffix = """});"""
-            as_str = prefix + as_str + '\n' + suffix
+            writer.write("""\n});""")
+
+        if buf is not None:
+            return None
+
+        as_str = writer.getvalue()
 
         if validators.path(filename, allow_empty = True):
-            with open(filename, 'w', encoding = encoding) as file_:
+            with open(filename,
+                      'w',
+                      encoding = encoding,
+                      buffering = constants.FILE_WRITE_BUFFER_SIZE) as file_:
                 file_.write(as_str)
 
         return as_str
@@ -690,6 +699,33 @@ class Chart(HighchartsMeta):
                                              format_ = format,
                                              **kwargs)
 
+    @staticmethod
+    def _get_series_key(item):
+        """Return a hashable key used to index series when matching them in
+        :meth:`_copy_dict_key() <Chart._copy_dict_key>`.
+
+        The key fingerprints the series' keys together with any scalar (string,
+        numeric, boolean, or :obj:`None <python:None>`) values. Series which are
+        equivalent (per
+        :func:`are_dicts_equivalent() <validator_collection.checkers.are_dicts_equivalent>`)
+        are guaranteed to produce the same key, so the key can be used to narrow the
+        set of candidates that need a full equivalence check.
+
+        :param item: The series (as a :class:`dict <python:dict>`) to index.
+        :type item: :class:`dict <python:dict>`
+
+        :returns: A hashable key, or :obj:`None <python:None>` if ``item`` is not a
+          :class:`dict <python:dict>` (and therefore cannot be matched).
+        :rtype: :class:`frozenset <python:frozenset>` or :obj:`None <python:None>`
+        """
+        if not isinstance(item, dict):
+            return None
+
+        return frozenset((key, value)
+                         if value is None or isinstance(value, (str, int, float, bool))
+                         else key
+                         for key, value in item.items())
+
     @classmethod
     def _copy_dict_key(cls,
                        key,
@@ -718,6 +754,7 @@ class Chart(HighchartsMeta):
             other = {}
 
         other_value = other.get(key, None)
+        original_type = type(original_value)
 
         if key == 'data' and preserve_data:
             return other_value
@@ -727,14 +764,21 @@ class Chart(HighchartsMeta):
 
         if key == 'series' and preserve_data:
             if not other_value:
-                return [x for x in original_value]
+                return list(original_value)
 
             if len(other_value) != len(original_value):
+                other_index = {}
+                for other_item in other_value:
+                    other_key = cls._get_series_key(other_item)
+                    if other_key is not None:
+                        other_index.setdefault(other_key, []).append(other_item)
+
                 matched_series = []
                 new_series = []
                 for original_item in original_value:
                     matched = False
-                    for other_item in other_value:
+                    candidates = other_index.get(cls._get_series_key(original_item), [])
+                    for other_item in candidates:
                         if checkers.are_dicts_equivalent(original_item, other_item):
                             matched_series.append((original_item, other_item))
                             matched = True
@@ -758,7 +802,15 @@ class Chart(HighchartsMeta):
 
                 return updated_series
 
-        elif isinstance(original_value, (dict, UserDict)):
+        elif original_type is list:
+            if overwrite:
+                new_value = list(original_value)
+
+                return new_value
+
+            return other_value
+
+        elif original_type is dict or isinstance(original_value, (dict, UserDict)):
             new_value = {subkey: cls._copy_dict_key(subkey,
                                                    original_value,
                                                    other_value,
@@ -774,7 +826,7 @@ class Chart(HighchartsMeta):
                                                      dict,
                                                      UserDict)):
             if overwrite:
-                new_value = [x for x in original_value]
+                new_value = list(original_value)
 
                 return new_value
 
@@ -43,6 +43,8 @@ while indent_count < int(JAVASCRIPT_INDENT_SPACES):
     JAVASCRIPT_INDENT += ' '
     indent_count += 1
 
+FILE_WRITE_BUFFER_SIZE = 64 * 1024
+
 DEFAULT_COLORS = ["#7cb5ec", "#434348", "#90ed7d", "#f7a35c", "#8085e9", "#f15c80",
                   "#e4d354", "#2b908f", "#f45b5b", "#91e8e1"]
 
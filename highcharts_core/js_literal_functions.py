@@ -50,6 +50,12 @@ def serialize_to_js_literal(item,
     :rtype: :class:`str <python:str>` or :obj:`None <python:None>`
     """
     if not ignore_to_array and hasattr(item, 'to_array'):
+        from highcharts_core.options.series.data.collections import DataPointCollection
+
+        if isinstance(item, DataPointCollection):
+            return item.to_js_literal(encoding = encoding,
+                                      careful_validation = careful_validation)
+
         requires_js_objects = getattr(item, 'requires_js_object', True)
         if requires_js_objects and hasattr(item, 'to_js_literal'):
             return item.to_js_literal(encoding = encoding,
@@ -34,6 +34,8 @@ class HighchartsMeta(ABC):
     """Metaclass that is used to define the standard interface exposed for serializable
     objects."""
 
+    __slots__ = ()
+
     def __init__(self, **kwargs):
         for key in kwargs:
             setattr(self, key, kwargs.get(key, None))
@@ -72,6 +74,22 @@ class HighchartsMeta(ABC):
         """
         return None
 
+    def _get_instance_attribute_names(self) -> List[str]:
+        """Return the names of the attributes stored on the instance, whether they
+        live in the instance's ``__dict__`` or in ``__slots__`` declared along its MRO.
+
+        :rtype: :class:`list <python:list>` of :class:`str <python:str>`
+        """
+        names = list(getattr(self, '__dict__', {}))
+        for class_ in type(self).__mro__:
+            slots = class_.__dict__.get('__slots__', ())
+            if isinstance(slots, str):
+                slots = (slots, )
+            names.extend([x for x in slots
+                          if x not in ('__dict__', '__weakref__') and x not in names])
+
+        return names
+
     def _process_required_modules(self, scripts = None, include_extension = False) -> List[str]:
         """Return the list of URLs from which the Highcharts JavaScript modules
         needed to render the chart can be retrieved.
@@ -89,7 +107,7 @@ class HighchartsMeta(ABC):
             scripts = []
         
         properties = {}
-        for key in self.__dict__:
+        for key in self._get_instance_attribute_names():
             if key[0] != '_':
                 continue
 
@@ -546,14 +564,15 @@ class HighchartsMeta(ABC):
             filename = validators.path(filename)
 
         untrimmed = self._to_untrimmed_dict()
-        as_dict = {}
-        for key in untrimmed:
-            item = untrimmed[key]
-            serialized = serialize_to_js_literal(item, 
-                                                 encoding = encoding,
-                                                 careful_validation = careful_validation)
-            if serialized is not None:
-                as_dict[key] = serialized
+        as_dict = {
+            key: serialized
+            for key, item in untrimmed.items()
+            if (serialized := serialize_to_js_literal(
+                item,
+                encoding = encoding,
+                careful_validation = careful_validation
+            )) is not None
+        }
 
         as_str = assemble_js_literal(as_dict,
                                      careful_validation = careful_validation)
@@ -727,7 +746,16 @@ class HighchartsMeta(ABC):
         else:
             other_value = other.get(key, None)
 
-        if isinstance(original_value, (dict, UserDict)):
+        original_type = type(original_value)
+        if original_type is list:
+            if overwrite:
+                new_value = list(original_value)
+
+                return new_value
+
+            return other_value
+
+        elif original_type is dict or isinstance(original_value, (dict, UserDict)):
             new_value = {}
             for subkey in original_value:
                 new_key_value = cls._copy_dict_key(subkey,
@@ -745,7 +773,7 @@ class HighchartsMeta(ABC):
                                                      dict,
                                                      UserDict)):
             if overwrite:
-                new_value = [x for x in original_value]
+                new_value = list(original_value)
 
                 return new_value
 
@@ -1150,14 +1178,15 @@ class JavaScriptDict(UserDict):
             filename = validators.path(filename)
 
         untrimmed = self._to_untrimmed_dict()
-        as_dict = {}
-        for key in untrimmed:
-            item = untrimmed[key]
-            serialized = serialize_to_js_literal(item, 
-                                                 encoding = encoding,
-                                                 careful_validation = careful_validation)
-            if serialized is not None:
-                as_dict[key] = serialized
+        as_dict = {
+            key: serialized
+            for key, item in untrimmed.items()
+            if (serialized := serialize_to_js_literal(
+                item,
+                encoding = encoding,
+                careful_validation = careful_validation
+            )) is not None
+        }
 
         as_str = assemble_js_literal(as_dict, 
                                      keys_as_strings = True,
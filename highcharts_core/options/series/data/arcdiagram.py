@@ -15,10 +15,32 @@ from highcharts_core.options.series.data.collections import DataPointCollection
 from highcharts_core.utility_classes.gradients import Gradient
 from highcharts_core.utility_classes.patterns import Pattern
 
+_KEY_MAP: tuple[tuple[str, str], ...] = (
+    ('accessibility', 'accessibility'),
+    ('class_name', 'className'),
+    ('color', 'color'),
+    ('color_index', 'colorIndex'),
+    ('custom', 'custom'),
+    ('description', 'description'),
+    ('events', 'events'),
+    ('id', 'id'),
+    ('label_rank', 'labelrank'),
+    ('name', 'name'),
+    ('selected', 'selected'),
+
+    ('from_', 'from'),
+    ('to', 'to'),
+    ('weight', 'weight'),
+)
+
 
 class ArcDiagramData(DataBase):
     """The definition of a data point for use in an :class:`ArcDiagramSeries`."""
 
+    __slots__ = ('_from_',
+                 '_to',
+                 '_weight')
+
     def __init__(self, **kwargs):
         self._from_ = None
         self._to = None
@@ -63,6 +85,9 @@ class ArcDiagramData(DataBase):
 
     @from_.setter
     def from_(self, value):
+        if value is self._from_:
+            return
+
         self._from_ = validators.string(value, allow_empty = True)
 
     @property
@@ -76,6 +101,9 @@ class ArcDiagramData(DataBase):
 
     @to.setter
     def to(self, value):
+        if value is self._to:
+            return
+
         self._to = validators.string(value, allow_empty = True)
 
     @property
@@ -89,10 +117,18 @@ class ArcDiagramData(DataBase):
 
     @weight.setter
     def weight(self, value):
+        if value is self._weight:
+            return
+
         self._weight = validators.numeric(value, allow_empty = True)
 
     @classmethod
-    def from_list(cls, value):
+    def from_list(cls, value) -> List[DataBase] | DataPointCollection:
+        if HAS_NUMPY and isinstance(value, np.ndarray):
+            if value.ndim == 2 and value.shape[1] == 3:
+                return cls.from_ndarray(value)
+            value = value.tolist()
+
         if not value:
             return []
         elif checkers.is_string(value):
@@ -105,7 +141,19 @@ class ArcDiagramData(DataBase):
 
         collection = []
         for item in value:
-            if checkers.is_type(item, 'SinglePointData'):
+            item_type = type(item)
+            if item_type is list or item_type is tuple:
+                if len(item) != 3:
+                    raise errors.HighchartsValueError(f'each data point supplied must either '
+                                                      f'be an Arc Diagram Data Point or be '
+                                                      f'coercable to one. Could not coerce: '
+                                                      f'{item}')
+                as_obj = cls(from_ = item[0],
+                             to = item[1],
+                             weight = item[2])
+            elif item_type is dict:
+                as_obj = cls.from_dict(item)
+            elif checkers.is_type(item, 'ArcDiagramData'):
                 as_obj = item
             elif checkers.is_dict(item):
                 as_obj = cls.from_dict(item)
@@ -180,44 +228,39 @@ class ArcDiagramData(DataBase):
         :rtype: :class:`dict <python:dict>`
 
         """
-        kwargs = {
-            'accessibility': as_dict.get('accessibility', None),
-            'class_name': as_dict.get('className', None),
-            'color': as_dict.get('color', None),
-            'color_index': as_dict.get('colorIndex', None),
-            'custom': as_dict.get('custom', None),
-            'description': as_dict.get('description', None),
-            'events': as_dict.get('events', None),
-            'id': as_dict.get('id', None),
-            'label_rank': as_dict.get('labelrank', None),
-            'name': as_dict.get('name', None),
-            'selected': as_dict.get('selected', None),
-
-            'from_': as_dict.get('from', None),
-            'to': as_dict.get('to', None),
-            'weight': as_dict.get('weight', None),
-        }
-
-        return kwargs
+        return {key: as_dict.get(js_key, None) for key, js_key in _KEY_MAP}
 
     def _to_untrimmed_dict(self, in_cls = None) -> dict:
-        untrimmed = {
-            'from': self.from_,
-            'to': self.to,
-            'weight': self.weight,
-
-            'accessibility': self.accessibility,
-            'className': self.class_name,
-            'color': self.color,
-            'colorIndex': self.color_index,
-            'custom': self.custom,
-            'description': self.description,
-            'events': self.events,
-            'id': self.id,
-            'labelrank': self.label_rank,
-            'name': self.name,
-            'selected': self.selected,
-        }
+        untrimmed = {}
+        if self._from_ is not None:
+            untrimmed['from'] = self._from_
+        if self._to is not None:
+            untrimmed['to'] = self._to
+        if self._weight is not None:
+            untrimmed['weight'] = self._weight
+
+        if self._accessibility is not None:
+            untrimmed['accessibility'] = self._accessibility
+        if self._class_name is not None:
+            untrimmed['className'] = self._class_name
+        if self._color is not None:
+            untrimmed['color'] = self._color
+        if self._color_index is not None:
+            untrimmed['colorIndex'] = self._color_index
+        if self._custom is not None:
+            untrimmed['custom'] = self._custom
+        if self._description is not None:
+            untrimmed['description'] = self._description
+        if self._events is not None:
+            untrimmed['events'] = self._events
+        if self._id is not None:
+            untrimmed['id'] = self._id
+        if self._label_rank is not None:
+            untrimmed['labelrank'] = self._label_rank
+        if self._name is not None:
+            untrimmed['name'] = self._name
+        if self._selected is not None:
+            untrimmed['selected'] = self._selected
 
         return untrimmed
 
@@ -233,12 +276,302 @@ class ArcDiagramDataCollection(DataPointCollection):
       style, names, identifiers, etc.). If serializing to a primitive array is not possible, the
       results are serialized as JS literal objects.
 
+    .. note::
+
+      Links supplied as a :class:`numpy.ndarray <numpy:numpy.ndarray>` of
+      ``[from, to, weight]`` rows are stored column-wise in
+      :meth:`.ndarray <highcharts_core.options.series.data.collections.DataPointCollection.ndarray>`.
+      An :class:`ArcDiagramData` instance is only created for a link when that link is
+      requested (by index or by iterating over the collection). The instance is kept
+      by the collection, so changes made to it are reflected when the collection is
+      serialized, while the remaining links stay column-wise.
+
     """
 
+    def __init__(self, **kwargs):
+        self._point_overrides = {}
+
+        super().__init__(**kwargs)
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+
+        if name in ['array', 'ndarray', 'data_points']:
+            self._point_overrides = {}
+        elif name in ['from_', 'to', 'weight'] and self._point_overrides:
+            if self._has_link_columns():
+                for index, data_point in self._point_overrides.items():
+                    setattr(data_point, name, self._get_link_value(name, index))
+
+    def __getitem__(self, index):
+        """Return the data point at ``index``.
+
+        .. note::
+
+          If the collection's links are stored column-wise, only the requested
+          :class:`ArcDiagramData` instances are created. They are kept by the
+          collection, so changes made to them are reflected in the collection.
+
+        :param index: The index of the data point to return.
+        :type index: :class:`int <python:int>` or :class:`slice <python:slice>`
+
+        :rtype: :class:`ArcDiagramData` or :class:`list <python:list>` of
+          :class:`ArcDiagramData`
+        """
+        if self._has_link_columns():
+            if isinstance(index, slice):
+                return [self._get_link_data_point(x)
+                        for x in range(*index.indices(len(self)))]
+
+            return self._get_link_data_point(index)
+
+        return self.to_array(force_object = True)[index]
+
+    def _get_link_value(self, key, index):
+        """Return the value of column ``key`` for the link at ``index`` as a Python
+        value, with :obj:`numpy.nan <numpy:numpy.nan>` converted to
+        :obj:`None <python:None>`.
+
+        :param key: The column to read (``'from_'``, ``'to'``, or ``'weight'``).
+        :type key: :class:`str <python:str>`
+
+        :param index: The (non-negative) index of the link.
+        :type index: :class:`int <python:int>`
+        """
+        value = self.ndarray[key][index]
+        if hasattr(value, 'item'):
+            value = value.item()
+        if isinstance(value, float) and np.isnan(value):
+            value = None
+
+        return value
+
+    def _get_link_data_point(self, index):
+        """Return the :class:`ArcDiagramData` for the link at ``index``, creating it
+        from the collection's columns and keeping it the first time it is requested.
+
+        :param index: The index of the link.
+        :type index: :class:`int <python:int>`
+
+        :rtype: :class:`ArcDiagramData`
+
+        :raises IndexError: if ``index`` is out of range
+        """
+        length = self.ndarray_length
+        if index < 0:
+            index += length
+        if index < 0 or index >= length:
+            raise IndexError('ArcDiagramDataCollection index out of range')
+
+        data_point = self._point_overrides.get(index, None)
+        if data_point is None:
+            data_point = ArcDiagramData(from_ = self._get_link_value('from_', index),
+                                        to = self._get_link_value('to', index),
+                                        weight = self._get_link_value('weight', index))
+            self._point_overrides[index] = data_point
+
+        return data_point
+
+    def _apply_point_overrides(self):
+        """Write the ``from_``, ``to``, and ``weight`` values of any
+        :class:`ArcDiagramData` instances handed out by the collection back into its
+        columns.
+
+        A column is converted to an object array only if one of its values changed.
+        """
+        if not self._point_overrides:
+            return
+
+        for key in ['from_', 'to', 'weight']:
+            updates = {}
+            for index, data_point in self._point_overrides.items():
+                value = getattr(data_point, key)
+                current = self._get_link_value(key, index)
+                if type(value) is not type(current) or value != current:
+                    updates[index] = value
+
+            if not updates:
+                continue
+
+            column = self.ndarray[key]
+            if column.dtype.char != 'O':
+                as_object = np.empty(len(column), dtype = object)
+                as_object[:] = [self._get_link_value(key, x) for x in range(len(column))]
+                column = as_object
+            for index, value in updates.items():
+                column[index] = value
+
+            self.ndarray[key] = column
+
+    def _assemble_data_points(self):
+        if self._has_link_columns():
+            return [self._get_link_data_point(x) for x in range(self.ndarray_length)]
+
+        return super()._assemble_data_points()
+
+    @property
+    def requires_js_object(self) -> bool:
+        """Indicates whether or not the data point *must* be serialized to a JS literal
+        object or whether it can be serialized to a primitive array.
+
+        :returns: ``True`` if the data point *must* be serialized to a JS literal object.
+          ``False`` if it can be serialized to an array.
+        :rtype: :class:`bool <python:bool>`
+        """
+        if self._has_link_columns():
+            return any(x.requires_js_object for x in self._point_overrides.values())
+
+        return super().requires_js_object
+
+    def _has_link_columns(self) -> bool:
+        """Indicates whether the collection's links are held exclusively in
+        :meth:`.ndarray <highcharts_core.options.series.data.collections.DataPointCollection.ndarray>`
+        columns, with no per-point properties configured.
+
+        :rtype: :class:`bool <python:bool>`
+        """
+        if not HAS_NUMPY or self.ndarray is None or self.data_points:
+            return False
+
+        return all(key in self.ndarray for key in ['from_', 'to', 'weight'])
+
     @classmethod
     def _get_data_point_class(cls):
         """The Python class to use as the underlying data point within the Collection.
         
         :rtype: class object
         """
-        return ArcDiagramData
\ No newline at end of file
+        return ArcDiagramData
+
+    @classmethod
+    def _from_links_ndarray(cls, value):
+        """Create a collection directly from a 2D
+        :class:`numpy.ndarray <numpy:numpy.ndarray>` of ``[from, to, weight]`` links,
+        without instantiating an :class:`ArcDiagramData` for each link.
+
+        The links are stored column-wise in
+        :meth:`.ndarray <highcharts_core.options.series.data.collections.DataPointCollection.ndarray>`,
+        with ``from_`` and ``to`` held as object arrays. ``weight`` is held as an
+        integer or float array if all weights share that type, and as an object array
+        otherwise. Values are validated the same way as the :class:`ArcDiagramData`
+        setters would validate them.
+
+        :param value: The array of links, with a shape of ``(N, 3)``.
+        :type value: :class:`numpy.ndarray <numpy:numpy.ndarray>`
+
+        :returns: The collection, or :obj:`None <python:None>` if ``value`` does not
+          contain string ``from``/``to`` values and numeric ``weight`` values (in which
+          case the data points should be created individually).
+        :rtype: :class:`ArcDiagramDataCollection` or :obj:`None <python:None>`
+        """
+        if not HAS_NUMPY or not isinstance(value, np.ndarray):
+            return None
+        if value.ndim != 2 or value.shape[1] != 3 or value.dtype.char not in ['O', 'U']:
+            return None
+
+        columns = []
+        for column in (value[:, 0].tolist(), value[:, 1].tolist()):
+            if not all(x is None or isinstance(x, str) for x in column):
+                return None
+            as_array = np.empty(len(column), dtype = object)
+            as_array[:] = [validators.string(x, allow_empty = True) for x in column]
+            columns.append(as_array)
+
+        from_, to = columns
+
+        weights = value[:, 2].tolist()
+        if any(isinstance(x, bool) for x in weights):
+            return None
+        try:
+            weights = [validators.numeric(x, allow_empty = True) for x in weights]
+        except (TypeError, ValueError):
+            return None
+
+        weight = np.empty(len(weights), dtype = object)
+        weight[:] = weights
+        if all(type(x) is int for x in weights):
+            try:
+                weight = weight.astype(np.int64)
+            except OverflowError:
+                pass
+        elif all(type(x) is float for x in weights):
+            weight = weight.astype(np.float64)
+
+        return cls(ndarray = {
+            'from_': from_,
+            'to': to,
+            'weight': weight
+        })
+
+    @classmethod
+    def from_ndarray(cls, value):
+        """Creates a
+        :class:`ArcDiagramDataCollection <highcharts_core.options.series.data.arcdiagram.ArcDiagramDataCollection>`
+        instance from an array of values.
+
+        .. note::
+
+          If ``value`` is a 2D array of ``[from, to, weight]`` links, the links are
+          stored column-wise without creating an :class:`ArcDiagramData` instance per
+          link.
+
+        :param value: The value that should contain the data which will be converted into
+          data point instances.
+        :type value: :class:`numpy.ndarray <numpy:numpy.ndarray>`
+
+        :returns: A single-object collection of data points.
+        :rtype: :class:`ArcDiagramDataCollection <highcharts_core.options.series.data.arcdiagram.ArcDiagramDataCollection>`
+          or :obj:`None <python:None>`
+
+        :raises HighchartsDependencyError: if `NumPy <https://numpy.org>`__ is not installed
+        """
+        as_collection = cls._from_links_ndarray(value)
+        if as_collection is not None:
+            return as_collection
+
+        return super().from_ndarray(value)
+
+    def to_array(self, force_object = False, force_ndarray = False) -> List:
+        """Generate the array representation of the data points (the inversion 
+        of 
+        :meth:`.from_array() <highcharts_core.options.series.data.base.DataBase.from_array>`).
+
+        .. note::
+
+          If the collection's links are stored column-wise and none of the data
+          points it has handed out require a JS literal object, the
+          ``[from, to, weight]`` arrays are produced from the columns in a single pass
+          without creating :class:`ArcDiagramData` instances.
+
+        :param force_object: if ``True``, forces the return of the instance's
+          untrimmed :class:`dict <python:dict>` representation. Defaults to ``False``.
+        :type force_object: :class:`bool <python:bool>`
+
+        :param force_ndarray: if ``True``, forces the return of the instance's
+          data points as a :class:`numpy.ndarray <numpy:numpy.ndarray>`. Defaults to
+          ``False``.
+        :type force_ndarray: :class:`bool <python:bool>`
+
+        :raises HighchartsValueError: if both `force_object` and `force_ndarray` are
+          ``True``
+
+        :returns: The array representation of the data point collection.
+        :rtype: :class:`list <python:list>`
+        """
+        if self._has_link_columns():
+            self._apply_point_overrides()
+
+        if force_object or force_ndarray or not self._has_link_columns() or \
+           self.requires_js_object:
+            return super().to_array(force_object = force_object,
+                                    force_ndarray = force_ndarray)
+
+        weight = self.ndarray['weight']
+        if weight.dtype.kind == 'f':
+            weight = np.where(np.isnan(weight), None, weight)
+
+        columns = [self.ndarray['from_'].astype(object),
+                   self.ndarray['to'].astype(object),
+                   weight.astype(object)]
+
+        return np.stack(columns, axis = 1).tolist()
@@ -22,6 +22,13 @@ from highcharts_core.options.series.data.accessibility import DataPointAccessibi
 class DataCore(HighchartsMeta):
     """Primary base class for describing a data point."""
 
+    __slots__ = ('_color',
+                 '_events',
+                 '_id',
+                 '_label_rank',
+                 '_name',
+                 '__weakref__')
+
     def __init__(self, **kwargs):
         self._color = None
         self._events = None
@@ -149,6 +156,16 @@ class DataCore(HighchartsMeta):
 class DataBase(DataCore):
     """Extended base class for describing a data point."""
 
+    __slots__ = ('_accessibility',
+                 '_class_name',
+                 '_color_index',
+                 '_custom',
+                 '_description',
+                 '_selected',
+                 # ``DataBase`` is used directly as the generic data point class, which
+                 # may receive arbitrary attributes.
+                 '__dict__')
+
     def __init__(self, **kwargs):
         self._accessibility = None
         self._class_name = None
@@ -467,7 +484,7 @@ class DataBase(DataCore):
                 item = value[index].item()
             else:
                 item = value[index]
-            if HAS_NUMPY and not checkers.is_string(item) and np.isnan(item):
+            if HAS_NUMPY and isinstance(item, float) and np.isnan(item):
                 item = None
             setattr(self, prop, item)
             if prop == 'name' and item is not None:
@@ -782,14 +799,15 @@ class DataBase(DataCore):
 
         untrimmed = self.to_array()
         if isinstance(untrimmed, dict):
-            as_dict = {}
-            for key in untrimmed:
-                item = untrimmed[key]
-                serialized = serialize_to_js_literal(item,
-                                                     encoding = encoding,
-                                                     careful_validation = careful_validation)
-                if serialized is not None:
-                    as_dict[key] = serialized
+            as_dict = {
+                key: serialized
+                for key, item in untrimmed.items()
+                if (serialized := serialize_to_js_literal(
+                    item,
+                    encoding = encoding,
+                    careful_validation = careful_validation
+                )) is not None
+            }
 
             as_str = assemble_js_literal(as_dict,
                                          careful_validation = careful_validation)
@@ -421,6 +421,13 @@ class DataPointCollection(HighchartsMeta):
         """A :class:`dict <python:dict>` whose keys correspond to data point properties, 
         and whose values are :class:`numpy.ndarray <numpy:numpy.ndarray>` instances that 
         contain the data point collection's values.
+
+        .. note::
+
+          May be set using a :class:`numpy.ndarray <numpy:numpy.ndarray>`, an iterable
+          that can be coerced to one, or a :class:`dict <python:dict>` whose keys are
+          data point properties and whose values are the (equal-length) columns for
+          those properties.
         
         :rtype: :class:`dict <python:dict>` or :obj:`None <python:None>`
         """
@@ -444,6 +451,31 @@ class DataPointCollection(HighchartsMeta):
         if value is None:
             self._ndarray = None
             as_array = False
+        elif HAS_NUMPY and isinstance(value, dict):
+            props_from_array = self._get_props_from_array()
+            for key in value:
+                if key not in props_from_array:
+                    raise errors.HighchartsValueError(f'{key} is not a property that '
+                                                      f'can be stored in .ndarray. '
+                                                      f'Expected one of: '
+                                                      f'{", ".join(props_from_array)}')
+            as_dict = {}
+            for prop in props_from_array:
+                if prop not in value:
+                    continue
+                prop_value = value[prop]
+                if not isinstance(prop_value, np.ndarray):
+                    prop_value = utility_functions.to_ndarray(prop_value)
+                as_dict[prop] = prop_value
+
+            lengths = set([len(x) for x in as_dict.values()])
+            if len(lengths) > 1:
+                raise errors.HighchartsValueError(f'.ndarray expects columns of equal '
+                                                  f'length. Received lengths: '
+                                                  f'{sorted(lengths)}')
+
+            self._ndarray = as_dict or None
+            return
         elif HAS_NUMPY and not isinstance(value, np.ndarray) and is_iterable:
             length = len(value[0])
             for item in value:
@@ -548,6 +580,8 @@ class DataPointCollection(HighchartsMeta):
             as_list = value
 
         data_points = cls._get_data_point_class().from_array(as_list)
+        if isinstance(data_points, cls):
+            return data_points
 
         return cls(data_points = data_points)
 
@@ -711,6 +745,50 @@ class DataPointCollection(HighchartsMeta):
         
         return utility_functions.to_ndarray(as_list)
 
+    def _ndarray_to_js_literal(self) -> Optional[str]:
+        """Serialize the numeric columns stored in
+        :meth:`.ndarray <highcharts_core.options.series.data.collections.DataPointCollection.ndarray>`
+        directly to a JavaScript array literal, without first assembling the nested
+        :class:`list <python:list>` returned by
+        :meth:`.to_array() <highcharts_core.options.series.data.collections.DataPointCollection.to_array>`.
+
+        The output is identical to serializing the result of
+        :meth:`.to_array() <highcharts_core.options.series.data.collections.DataPointCollection.to_array>`.
+
+        :returns: The JavaScript array literal, or :obj:`None <python:None>` if the
+          collection holds data points or any non-numeric column (in which case the
+          standard serialization should be used).
+        :rtype: :class:`str <python:str>` or :obj:`None <python:None>`
+        """
+        if not HAS_NUMPY or self.ndarray is None or self.data_points:
+            return None
+
+        columns = []
+        for key in self.ndarray:
+            value = self.ndarray[key]
+            if not utility_functions.is_ndarray(value) or value.ndim != 1:
+                return None
+            kind = value.dtype.kind
+            if kind == 'b':
+                column = ['true' if x else 'false' for x in value.tolist()]
+            elif kind in 'iu':
+                column = [str(x) for x in value.tolist()]
+            elif kind == 'f':
+                column = [str(x) for x in value.tolist()]
+                for index in np.flatnonzero(np.isnan(value)).tolist():
+                    column[index] = 'null'
+            else:
+                return None
+
+            columns.append(column)
+
+        if not columns or not columns[0]:
+            return None
+
+        rows = ['[' + ',\n'.join(row) + ']' for row in zip(*columns)]
+
+        return '[' + ',\n'.join(rows) + ']'
+
     def to_array(self, force_object = False, force_ndarray = False) -> List:
         """Generate the array representation of the data points (the inversion 
         of 
@@ -873,9 +951,16 @@ class DataPointCollection(HighchartsMeta):
         if filename:
             filename = validators.path(filename)
 
+        as_str = self._ndarray_to_js_literal()
+        if as_str is not None:
+            if filename:
+                with open(filename, 'w', encoding = encoding) as file_:
+                    file_.write(as_str)
+
+            return as_str
+
         untrimmed = self.to_array()
-        is_ndarray = all([isinstance(x, list) for x in untrimmed])
-        if not is_ndarray:
+        if self.requires_js_object:
             as_str = '['
             as_str += ','.join([x.to_js_literal(encoding = encoding,
                                                 careful_validation = careful_validation)
@@ -0,0 +1,200 @@
+"""Tests for ``highcharts.no_data``."""
+
+import weakref
+
+import pytest
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+from highcharts_core.options.series.data.arcdiagram import ArcDiagramData as cls
+from highcharts_core.options.series.data.arcdiagram import ArcDiagramDataCollection as cls2
+from highcharts_core import errors
+from validator_collection import errors as validator_errors
+from tests.fixtures import input_files, check_input_file, to_camelCase, to_js_dict, \
+    Class__init__, Class__to_untrimmed_dict, Class_from_dict, Class_to_dict
+
+STANDARD_PARAMS = [
+    ({}, None),
+    ({
+      'from_': 'Node A',
+      'to': 'Node B',
+      'weight': 12
+    }, None),
+    ({
+      'from_': 'Node A',
+      'to': 'Node B',
+      'weight': 12,
+      'color': '#ccc',
+      'id': 'some-id',
+      'name': 'Some Name'
+    }, None),
+]
+
+
+@pytest.mark.parametrize('kwargs, error', STANDARD_PARAMS)
+def test_ArcDiagramData__init__(kwargs, error):
+    Class__init__(cls, kwargs, error)
+
+
+@pytest.mark.parametrize('kwargs, error', STANDARD_PARAMS)
+def test_ArcDiagramData__to_untrimmed_dict(kwargs, error):
+    Class__to_untrimmed_dict(cls, kwargs, error)
+
+
+@pytest.mark.parametrize('kwargs, error',  STANDARD_PARAMS)
+def test_ArcDiagramData_from_dict(kwargs, error):
+    Class_from_dict(cls, kwargs, error)
+
+
+@pytest.mark.parametrize('kwargs, error',  STANDARD_PARAMS)
+def test_ArcDiagramData_to_dict(kwargs, error):
+    Class_to_dict(cls, kwargs, error)
+
+
+@pytest.mark.parametrize('value, expected_type, expected, error', [
+    ([], list, [], None),
+    ([['A', 'B', 1], ['B', 'C', 2]],
+     list,
+     [['A', 'B', 1], ['B', 'C', 2]],
+     None),
+    ([('A', 'B', 1), ('B', 'C', 2.5)],
+     list,
+     [['A', 'B', 1], ['B', 'C', 2.5]],
+     None),
+    ([['', 'B', 1], ['A', 'C', None]],
+     list,
+     [[None, 'B', 1], ['A', 'C', None]],
+     None),
+    ([['A', 'B', 1], {'from': 'B', 'to': 'C', 'weight': 2}],
+     list,
+     [['A', 'B', 1], ['B', 'C', 2]],
+     None),
+    ([cls(from_ = 'A', to = 'B', weight = 1), ('B', 'C', 2)],
+     list,
+     [['A', 'B', 1], ['B', 'C', 2]],
+     None),
+    ([['A', 'B', 1], ['B', 2, 2]], None, None, validator_errors.CannotCoerceError),
+    ([['A', 'B', 1], ['B', 'C']], None, None, errors.HighchartsValueError),
+])
+def test_ArcDiagramData_from_list(value, expected_type, expected, error):
+    if not error:
+        result = cls.from_list(value)
+        assert isinstance(result, expected_type) is True
+        assert [x.to_array() for x in result] == expected
+        for row, expected_row in zip(result, expected):
+            assert [type(x) for x in row.to_array()] == [type(x) for x in expected_row]
+    else:
+        with pytest.raises(error):
+            result = cls.from_list(value)
+
+
+@pytest.mark.skipif(not HAS_NUMPY, reason = 'requires NumPy')
+@pytest.mark.parametrize('value, expected, error', [
+    (np.array([['A', 'B', 1], ['B', 'C', 2]], dtype = object) if HAS_NUMPY else None,
+     [['A', 'B', 1], ['B', 'C', 2]],
+     None),
+    (np.array([['A', 'B', 1], ['B', 'C', 2.5]]) if HAS_NUMPY else None,
+     [['A', 'B', 1.0], ['B', 'C', 2.5]],
+     None),
+    (np.array([['', 'B', 1], ['B', 'C', 2.5]], dtype = object) if HAS_NUMPY else None,
+     [[None, 'B', 1], ['B', 'C', 2.5]],
+     None),
+    (np.array([['A', 'B', 1], ['A', 'C', None]], dtype = object) if HAS_NUMPY else None,
+     [['A', 'B', 1], ['A', 'C', None]],
+     None),
+])
+def test_ArcDiagramDataCollection_from_ndarray(value, expected, error):
+    if not error:
+        result = cls2.from_ndarray(value)
+        assert isinstance(result, cls2) is True
+        assert result.data_points is None
+        assert list(result.ndarray.keys()) == ['from_', 'to', 'weight']
+        assert result.to_array() == expected
+        for row, expected_row in zip(result.to_array(), expected):
+            assert [type(x) for x in row] == [type(x) for x in expected_row]
+        assert len(result) == len(expected)
+
+        data_points = result.to_array(force_object = True)
+        assert len(data_points) == len(expected)
+        for index, data_point in enumerate(data_points):
+            assert isinstance(data_point, cls) is True
+            assert data_point.from_ == expected[index][0]
+            assert data_point.to == expected[index][1]
+            assert data_point.weight == expected[index][2]
+    else:
+        with pytest.raises(error):
+            result = cls2.from_ndarray(value)
+
+
+@pytest.mark.skipif(not HAS_NUMPY, reason = 'requires NumPy')
+@pytest.mark.parametrize('value, index, expected, error', [
+    ([['A', 'B', 1], ['B', 'C', 2]], 0, ('A', 'B', 1), None),
+    ([['A', 'B', 1], ['B', 'C', 2]], -1, ('B', 'C', 2), None),
+    ([['A', 'B', 1], ['B', 'C', None]], 1, ('B', 'C', None), None),
+    ([['A', 'B', 1], ['B', 'C', 2]], 2, None, IndexError),
+])
+def test_ArcDiagramDataCollection__getitem__(value, index, expected, error):
+    collection = cls2.from_ndarray(np.array(value, dtype = object))
+    if not error:
+        result = collection[index]
+        assert isinstance(result, cls) is True
+        assert (result.from_, result.to, result.weight) == expected
+        assert collection.ndarray is not None
+        assert collection.data_points is None
+
+        result.weight = 5
+        assert collection[index] is result
+        assert collection.to_array()[index] == [result.from_, result.to, 5]
+
+        result.color = '#fff'
+        assert collection[index].color == '#fff'
+        assert collection.to_array()[index].color == '#fff'
+        assert collection.ndarray is not None
+
+        for item in collection:
+            item.name = 'link'
+        assert all(x.name == 'link' for x in collection.to_array())
+    else:
+        with pytest.raises(error):
+            result = collection[index]
+
+
+@pytest.mark.skipif(not HAS_NUMPY, reason = 'requires NumPy')
+@pytest.mark.parametrize('value, expected', [
+    ([['A', 'B', 1], ['B', 'C', 2]], [['A', 'B', 1], ['B', 'C', 2]]),
+    ([['A', 'B', 1.5], ['B', 'C', None]], [['A', 'B', 1.5], ['B', 'C', None]]),
+])
+def test_ArcDiagramDataCollection_to_array(value, expected):
+    collection = cls2.from_ndarray(np.array(value, dtype = object))
+    result = collection.to_array()
+    assert result == expected
+    for row, expected_row in zip(result, expected):
+        assert [type(x) for x in row] == [type(x) for x in expected_row]
+
+
+@pytest.mark.parametrize('kwargs, expected', [
+    ({}, {}),
+    ({'from_': 'A', 'to': 'B', 'weight': 1}, {'from': 'A', 'to': 'B', 'weight': 1}),
+    ({'from_': 'A', 'weight': 0, 'selected': False},
+     {'from': 'A', 'weight': 0, 'selected': False}),
+])
+def test_ArcDiagramData__to_untrimmed_dict_skips_empty(kwargs, expected):
+    instance = cls(**kwargs)
+    assert instance._to_untrimmed_dict() == expected
+
+
+def test_ArcDiagramData__get_instance_attribute_names():
+    instance = cls(from_ = 'A', to = 'B', weight = 1)
+    result = instance._get_instance_attribute_names()
+    for name in ['_from_', '_to', '_weight', '_accessibility', '_color', '_name']:
+        assert name in result
+    assert len(result) == len(set(result))
+
+
+def test_ArcDiagramData_weakref():
+    instance = cls(from_ = 'A', to = 'B', weight = 1)
+    reference = weakref.ref(instance)
+    assert reference() is instance
@@ -465,3 +465,25 @@ def test__setattr__(name, value, expected, error):
         with pytest.raises(error):
             obj = cls()
             setattr(obj, name, value)
+
+
+@pytest.mark.skipif(not HAS_NUMPY, reason = 'requires NumPy')
+@pytest.mark.parametrize('value, expects_str', [
+    (np.array([[1, 2], [3, 4]]) if HAS_NUMPY else None, True),
+    (np.array([[1.5, np.nan], [3.25, 1e-09]]) if HAS_NUMPY else None, True),
+    (np.array([[True, 1], [False, 2]]) if HAS_NUMPY else None, True),
+    (np.array([[1, 2], [3, 4]], dtype = object) if HAS_NUMPY else None, False),
+])
+def test__ndarray_to_js_literal(value, expects_str):
+    from highcharts_core.options.series.data.cartesian import CartesianDataCollection
+    from highcharts_core.js_literal_functions import get_js_literal, \
+        serialize_to_js_literal
+
+    obj = CartesianDataCollection.from_ndarray(value)
+    result = obj._ndarray_to_js_literal()
+    if expects_str:
+        assert isinstance(result, str) is True
+        assert result == get_js_literal(serialize_to_js_literal(obj.to_array()))
+        assert obj.to_js_literal() == result
+    else:
+        assert result is None
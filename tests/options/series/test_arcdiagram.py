@@ -1284,3 +1284,32 @@ def test_to_dict(kwargs, error):
 ])
 def test_from_js_literal(input_files, filename, as_file, error):
     Class_from_js_literal(cls, input_files, filename, as_file, error)
+
+
+@pytest.mark.parametrize('data, expected', [
+    ([['A', 'B', 1], ['B', 'C', 2]],
+     [{'from': 'A', 'to': 'B', 'weight': 1}, {'from': 'B', 'to': 'C', 'weight': 2}]),
+    ([('A', 'B', 1), ('B', 'C', 2.5)],
+     [{'from': 'A', 'to': 'B', 'weight': 1}, {'from': 'B', 'to': 'C', 'weight': 2.5}]),
+])
+def test_data_round_trip(data, expected):
+    import json
+
+    from highcharts_core.chart import Chart
+
+    obj = cls(data = data)
+    expected_js = obj.to_js_literal()
+
+    as_dict = obj.to_dict()
+    assert as_dict['data'] == expected
+    assert cls.from_dict(as_dict).to_js_literal() == expected_js
+
+    as_json = obj.to_json()
+    assert json.loads(as_json)['data'] == expected
+
+    assert obj.copy().to_js_literal() == expected_js
+
+    chart = Chart.from_options({'series': [{'type': 'arcdiagram', 'data': data}]})
+    copied = chart.copy()
+    assert copied.to_js_literal() == chart.to_js_literal()
+    assert copied.options.series[0].to_dict()['data'] == expected
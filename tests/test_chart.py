@@ -1,5 +1,8 @@
 """Tests for ``highcharts.no_data``."""
 
+import io
+import weakref
+
 import pytest
 try:
     import numpy as np
@@ -11,6 +14,7 @@ from json.decoder import JSONDecodeError
 
 from highcharts_core.chart import Chart as cls
 from highcharts_core.global_options.shared_options import SharedOptions
+from highcharts_core.options import HighchartsOptions
 from highcharts_core import errors
 from tests.fixtures import input_files, check_input_file, to_camelCase, to_js_dict, \
     Class__init__, Class__to_untrimmed_dict, Class_from_dict, Class_to_dict, \
@@ -344,7 +348,141 @@ def test__str__(kwargs, error):
     else:
         with pytest.raises(error):
             result = str(obj)
-            
+
+
+@pytest.mark.parametrize('kwargs, error', [
+    ({}, None),
+    ({
+        'container': 'my-container-name',
+        'variable_name': 'myChart',
+        'options': {
+            'title': {
+                'text': 'My Chart'
+            }
+        }
+    }, None),
+    ({
+        'options': HighchartsOptions()
+    }, None),
+])
+def test_to_js_literal_buf(kwargs, error):
+    obj = cls(**kwargs)
+    if not error:
+        expected = obj.to_js_literal()
+        assert isinstance(expected, str) is True
+        buf = io.StringIO()
+        result = obj.to_js_literal(buf = buf)
+        assert result is None
+        assert buf.getvalue() == expected
+    else:
+        with pytest.raises(error):
+            obj.to_js_literal(buf = io.StringIO())
+
+
+class NonSeekableWriter(object):
+    def __init__(self):
+        self.parts = []
+
+    def write(self, value):
+        self.parts.append(value)
+
+    def seekable(self):
+        return False
+
+    def tell(self):
+        raise io.UnsupportedOperation('tell')
+
+
+@pytest.mark.parametrize('kwargs, expected_fragment', [
+    ({'container': 'c'}, "Highcharts.chart('c',\nnull);"),
+    ({'container': 'c', 'options': HighchartsOptions()}, "Highcharts.chart('c',\nnull);"),
+])
+def test_to_js_literal_buf_non_seekable(kwargs, expected_fragment):
+    obj = cls(**kwargs)
+    expected = obj.to_js_literal()
+    assert expected_fragment in expected
+
+    writer = NonSeekableWriter()
+    result = obj.to_js_literal(buf = writer)
+    assert result is None
+    assert ''.join(writer.parts) == expected
+
+
+@pytest.mark.parametrize('kwargs, encoding, error', [
+    ({}, 'utf-8', None),
+    ({
+        'container': 'my-container-name',
+        'options': {
+            'title': {
+                'text': 'My Chart – ünïcödé'
+            }
+        }
+    }, 'utf-8', None),
+    ({}, 'not-a-codec', LookupError),
+])
+def test_to_js_literal_filename(tmp_path, kwargs, encoding, error):
+    obj = cls(**kwargs)
+    filename = tmp_path / 'chart.js'
+    if not error:
+        result = obj.to_js_literal(filename = str(filename), encoding = encoding)
+        with open(filename, 'r', encoding = encoding) as file_:
+            assert file_.read() == result
+    else:
+        with pytest.raises(error):
+            obj.to_js_literal(filename = str(filename), encoding = encoding)
+
+
+@pytest.mark.parametrize('original, other, kwargs, expected, error', [
+    ({'series': [{'type': 'line', 'name': 'B'}, {'type': 'line', 'name': 'A'}]},
+     {'series': [{'type': 'line', 'name': 'A'}]},
+     {},
+     [{'type': 'line', 'name': 'A'}, {'type': 'line', 'name': 'B'}],
+     None),
+    ({'series': [{'type': 'line', 'name': 'A'}, {'type': 'bar', 'name': 'B'}]},
+     {'series': [{'type': 'line', 'name': 'C'}]},
+     {},
+     [{'type': 'line', 'name': 'A'}, {'type': 'bar', 'name': 'B'}],
+     None),
+    ({'series': [{'type': 'line', 'name': 'A', 'keys': ['x', 'y']},
+                 {'type': 'line', 'name': 'B', 'keys': ['x', 'y']}]},
+     {'series': [{'type': 'line', 'name': 'B', 'keys': ['y', 'x']}]},
+     {},
+     [{'type': 'line', 'name': 'B', 'keys': ['x', 'y']},
+      {'type': 'line', 'name': 'A', 'keys': ['x', 'y']}],
+     None),
+    ({'series': [{'type': 'line', 'name': 'A'}]},
+     {},
+     {},
+     [{'type': 'line', 'name': 'A'}],
+     None),
+    ({'series': [{'type': 'line', 'name': 'A'}]},
+     {'series': [{'type': 'line', 'name': 'C'}, {'type': 'line', 'name': 'D'}]},
+     {'preserve_data': False},
+     [{'type': 'line', 'name': 'A'}],
+     None),
+])
+def test__copy_dict_key_series(original, other, kwargs, expected, error):
+    if not error:
+        result = cls._copy_dict_key('series', original, other, **kwargs)
+        assert result == expected
+    else:
+        with pytest.raises(error):
+            result = cls._copy_dict_key('series', original, other, **kwargs)
+
+
+@pytest.mark.parametrize('key, original, other, kwargs, expected', [
+    ('keys', {'keys': ['x', 'y']}, {'keys': ['y']}, {}, ['x', 'y']),
+    ('keys', {'keys': ['x', 'y']}, {'keys': ['y']}, {'overwrite': False}, ['y']),
+    ('keys', {'keys': ('x', 'y')}, {}, {}, ['x', 'y']),
+    ('title', {'title': {'text': 'A'}}, {}, {}, {'text': 'A'}),
+    ('name', {'name': 'A'}, {'name': 'B'}, {'overwrite': False}, 'B'),
+])
+def test__copy_dict_key(key, original, other, kwargs, expected):
+    result = cls._copy_dict_key(key, original, other, **kwargs)
+    assert result == expected
+    if isinstance(expected, list) and kwargs.get('overwrite', True):
+        assert result is not original[key]
+
 
 @pytest.mark.parametrize('kwargs, expected_series, expected_data_points, error', [
     ({}, 0, [], None),
@@ -762,3 +900,30 @@ def test_from_array(value, expected_shape, has_ndarray, has_data_points, error):
     else:
         with pytest.raises(error):
             result = cls.from_array(value)
+
+
+@pytest.mark.parametrize('value, expected, error', [
+    (None, None, None),
+    ('', None, None),
+    ('myChart', 'myChart', None),
+    ('_chart_1', '_chart_1', None),
+    ('class', None, ValueError),
+    ('1chart', None, ValueError),
+    ('my-chart', None, ValueError),
+])
+def test_variable_name(value, expected, error):
+    obj = cls()
+    if not error:
+        obj.variable_name = value
+        assert obj.variable_name == expected
+        obj.variable_name = obj.variable_name
+        assert obj.variable_name == expected
+    else:
+        with pytest.raises(error):
+            obj.variable_name = value
+
+
+def test_weakref():
+    instance = cls()
+    reference = weakref.ref(instance)
+    assert reference() is instance